@@ -13,83 +13,116 @@ from model import CSV_to_table
 from model import table_to_CSV
 
 class Table:
+    # number of rows inserted into the treeview at a time
+    __ROW_LOAD_CHUNK_SIZE: int = 200
+    # delay in milliseconds before cell bar edits are written into the cell
+    __CELL_BAR_SAVE_DELAY_MS: int = 150
+
     def __init__(self, parent: tk.Widget, table_model: TableModel, *, editable: bool = False, cell_bar_visible = False):
         self.__editable: bool = False
+        # the state of the cell bar and the editor textbox, follows self.__editable
+        self.__editor_state: Literal['normal', 'disabled'] = tk.DISABLED
         self.__cell_bar_visible: bool = cell_bar_visible
         self.__selected_row_index: int = -1
         self.__selected_column_index: int = -1
-        self.__selected_textbox: tk.Text | None = None
+        # the cell currently shown in the editor textbox
+        self.__editor_row_index: int = -1
+        self.__editor_column_index: int = -1
+        # the cell currently shown in the cell bar
+        self.__cell_bar_row_index: int = -1
+        self.__cell_bar_column_index: int = -1
+        self.__cell_bar_save_id: str | None = None
+        self.__loaded_row_count: int = 0
 
         self.__default_font = ('Arial', 10)
 
         self.__table_model: TableModel = table_model
         column_names: tuple[str] = self.__table_model.get_column_names()
 
+        # treeview ids of every loaded row and every column, indexed by their row and column indices
+        self.__item_ids: list[str] = []
+        self.__column_ids: list[str] = ["#" + str(column_index + 1) for column_index in range(len(column_names))]
+
         # create a frame to wrap everything in this object
         self.__frame = ttk.Frame(parent, padding=5)
         self.__frame.pack(fill=tk.BOTH, expand=True)
 
+        # the cell bar and the table share a paned window, so the user can resize them against each other
+        self.__paned_window: ttk.PanedWindow = ttk.PanedWindow(self.__frame, orient=tk.VERTICAL)
+        self.__paned_window.pack(fill=tk.BOTH, expand=True)
+
         self.__cell_bar: tk.Text | None = None
-        treeview_grid_row = 0
-        if (self.is_cell_bar_visible()):
+        self.__cell_bar_vert_scrollbar: ttk.Scrollbar | None = None
+        if (self.__cell_bar_visible):
+            cell_bar_frame: ttk.Frame = ttk.Frame(self.__paned_window)
+
             # create cell bar
-            cell_bar = tk.Text(self.__frame, font=self.__default_font, wrap=tk.WORD, height=5, state=self.__get_editor_state())
+            cell_bar = tk.Text(cell_bar_frame, font=self.__default_font, wrap=tk.WORD, height=5, state=self.__editor_state)
             self.__cell_bar = cell_bar
-            cell_bar.grid(row=0, column=0, sticky="ew")
+            cell_bar.grid(row=0, column=0, sticky="nsew")
             
             # create vertical scrollbar
-            table_vert_scrollbar: ttk.Scrollbar = ttk.Scrollbar(self.__frame, orient=tk.VERTICAL, command=cell_bar.yview)
+            cell_bar_vert_scrollbar: ttk.Scrollbar = ttk.Scrollbar(cell_bar_frame, orient=tk.VERTICAL, command=cell_bar.yview)
+            self.__cell_bar_vert_scrollbar = cell_bar_vert_scrollbar
             # link the cell bar to the scrollbar
-            cell_bar.configure(yscrollcommand=table_vert_scrollbar.set)
+            cell_bar.configure(yscrollcommand=cell_bar_vert_scrollbar.set)
             # put vertical scrollbar right of the cell bar
-            table_vert_scrollbar.grid(row=0, column=1, sticky="ns")
-
-            def save_edit(event):
-                cell_bar_string: str = cell_bar.get("1.0", tk.END)
-                cell_indices: tuple[int, int] = (self.__selected_row_index, self.__selected_column_index)
-                self.__set_cell_value(cell_indices, cell_bar_string)
-                cell_bar.edit_modified(False)
+            cell_bar_vert_scrollbar.grid(row=0, column=1, sticky="ns")
 
             cell_bar.edit_modified(False)
+            # update the cell shortly after the cell bar is modified
+            cell_bar.bind("<<Modified>>", self.__on_cell_bar_modified)
             # update the cell when cell bar loses focus
-            cell_bar.bind("<<Modified>>", save_edit)
+            cell_bar.bind("<FocusOut>", self.__on_cell_bar_focus_out)
 
-            # ask treeview table to be placed under cell bar
-            treeview_grid_row = 1
+            # Configure grid weights to allow cell bar resizing
+            cell_bar_frame.grid_rowconfigure(0, weight=1)
+            cell_bar_frame.grid_columnconfigure(0, weight=1)
+
+            # put cell bar on top of the table
+            self.__paned_window.add(cell_bar_frame, weight=0)
+
+        table_frame: ttk.Frame = ttk.Frame(self.__paned_window)
 
         # create treeview to render the table
-        self.__tree: ttk.Treeview = ttk.Treeview(self.__frame, columns=column_names, show="headings")
+        self.__tree: ttk.Treeview = ttk.Treeview(table_frame, columns=column_names, show="headings")
         # place table heading into the treeview
         for column_name in column_names:
             self.__tree.heading(column_name, text=column_name)
 
-        # place table entries into the treeview
-        entry_models: list[EntryModel] = self.__table_model.get_entries()
-        row_index: int = 0
-        for entry_model in entry_models:
-            value_strings: list[str] = entry_model.get_value_str_from_columns()
-            self.__tree.insert("", tk.END, text="", values=value_strings, iid=row_index)
-            row_index += 1
-        # put table at the middle left
-        self.__tree.grid(row=treeview_grid_row, column=0, sticky="nsew")
+        # create the editor textbox, which is moved onto the selected cell
+        self.__editor_textbox: tk.Text = tk.Text(self.__tree, font=self.__default_font)
+        self.__editor_textbox.place_forget()
+        # update the cell when the editor textbox loses focus
+        self.__editor_textbox.bind("<FocusOut>", self.__on_editor_focus_out)
+
+        # place the first table entries into the treeview
+        # the remaining entries are inserted on demand when the table is scrolled to the bottom
+        # the treeview is not gridded yet, so no redraw happens during the bulk insert
+        self.__load_more_rows()
+        # put table at the top left
+        self.__tree.grid(row=0, column=0, sticky="nsew")
 
         # create horizontal scrollbar
-        table_hori_scrollbar: ttk.Scrollbar = ttk.Scrollbar(self.__frame, orient=tk.HORIZONTAL, command=self.__tree.xview)
+        self.__table_hori_scrollbar: ttk.Scrollbar = ttk.Scrollbar(table_frame, orient=tk.HORIZONTAL, command=self.__tree.xview)
         # link the table to the scrollbar
-        self.__tree.configure(xscrollcommand=table_hori_scrollbar.set)
+        self.__tree.configure(xscrollcommand=self.__table_hori_scrollbar.set)
         # put horizontal scrollbar below the table
-        table_hori_scrollbar.grid(row=treeview_grid_row + 1, column=0, sticky="ew")
+        self.__table_hori_scrollbar.grid(row=1, column=0, sticky="ew")
 
         # create vertical scrollbar
-        table_vert_scrollbar: ttk.Scrollbar = ttk.Scrollbar(self.__frame, orient=tk.VERTICAL, command=self.__tree.yview)
+        self.__table_vert_scrollbar: ttk.Scrollbar = ttk.Scrollbar(table_frame, orient=tk.VERTICAL, command=self.__tree.yview)
         # link the table to the scrollbar
-        self.__tree.configure(yscrollcommand=table_vert_scrollbar.set)
+        self.__tree.configure(yscrollcommand=self.__on_tree_yscroll)
         # put vertical scrollbar right of the table
-        table_vert_scrollbar.grid(row=treeview_grid_row, column=1, sticky="ns")
+        self.__table_vert_scrollbar.grid(row=0, column=1, sticky="ns")
 
         # Configure grid weights to allow table resizing
-        self.__frame.grid_rowconfigure(treeview_grid_row, weight=1)
-        self.__frame.grid_columnconfigure(0, weight=1)
+        table_frame.grid_rowconfigure(0, weight=1)
+        table_frame.grid_columnconfigure(0, weight=1)
+
+        # put table below the cell bar, taking all extra space
+        self.__paned_window.add(table_frame, weight=1)
 
         # configure whether the cells in this table are editable or not
         self.set_editable(editable)
@@ -110,32 +143,84 @@ class Table:
     
     def set_editable(self, editable: bool) -> None:
         self.__editable = editable
+        self.__editor_state = tk.NORMAL if editable else tk.DISABLED
         if (self.__cell_bar != None):
-            self.__cell_bar.config(state=self.__get_editor_state())
-        if (self.__selected_textbox != None):
-            self.__selected_textbox.config(state=self.__get_editor_state())
+            self.__cell_bar.config(state=self.__editor_state)
+        self.__editor_textbox.config(state=self.__editor_state)
 
     def is_editable(self) -> bool:
         return self.__editable
-
-    def __get_editor_state(self) -> Literal['normal', 'disabled']:
-        return tk.NORMAL if self.is_editable() else tk.DISABLED
     
     def is_cell_bar_visible(self) -> bool:
         return self.__cell_bar_visible
 
-    def __render_cell_bar(self, cell_position: tuple[str, str] | tuple[int, int]) -> None:
-        if ((not self.is_cell_bar_visible()) or (self.__cell_bar == None)):
+    def __render_cell_bar(self, cell_value: str) -> None:
+        if ((not self.__cell_bar_visible) or (self.__cell_bar == None)):
             return
-        cell_values = self.__get_cell_value(cell_position)
-        if (cell_values == None):
-            return
-        row_values, column_index, cell_value = cell_values
+        # keep the edits of the previous cell before the cell bar is overwritten
+        self.__save_cell_bar()
         self.__cell_bar.config(state=tk.NORMAL)
         self.__cell_bar.delete("1.0", tk.END)
         self.__cell_bar.insert("1.0", cell_value)
-        self.__cell_bar.config(state=self.__get_editor_state())
+        self.__cell_bar.edit_modified(False)
+        self.__cell_bar.config(state=self.__editor_state)
+        self.__cell_bar_row_index = self.__selected_row_index
+        self.__cell_bar_column_index = self.__selected_column_index
+
+    # @brief Writes the cell bar back into its cell if it has been edited.
+    # Cancels the pending delayed save, if any.
+    def __save_cell_bar(self) -> None:
+        if (self.__cell_bar_save_id != None):
+            self.__frame.after_cancel(self.__cell_bar_save_id)
+            self.__cell_bar_save_id = None
+        cell_bar: tk.Text | None = self.__cell_bar
+        if (cell_bar == None or (not cell_bar.winfo_exists())):
+            # the table has been closed
+            return
+        if ((not cell_bar.edit_modified()) or self.__cell_bar_row_index < 0):
+            return
+        # "end-1c" drops the newline which tk.Text always appends
+        cell_bar_string: str = cell_bar.get("1.0", "end-1c")
+        self.__set_cell_value_by_indices(self.__cell_bar_row_index, self.__cell_bar_column_index, cell_bar_string)
+        cell_bar.edit_modified(False)
+
+    # <<Modified>> only fires when the modified flag changes,
+    # so keystrokes typed before the delayed save are coalesced into it
+    def __on_cell_bar_modified(self, event) -> None:
+        if (self.__cell_bar == None or (not self.__cell_bar.edit_modified())):
+            return
+        if (self.__cell_bar_save_id != None):
+            self.__frame.after_cancel(self.__cell_bar_save_id)
+        self.__cell_bar_save_id = self.__frame.after(self.__CELL_BAR_SAVE_DELAY_MS, self.__save_cell_bar)
+
+    def __on_cell_bar_focus_out(self, event) -> None:
+        self.__frame.after_idle(self.__save_cell_bar)
     
+    # @brief Inserts the next chunk of not yet loaded entries into the treeview.
+    def __load_more_rows(self) -> None:
+        entry_models: list[EntryModel] = self.__table_model.get_entries()
+        first_row_index: int = self.__loaded_row_count
+        last_row_index: int = min(first_row_index + self.__ROW_LOAD_CHUNK_SIZE, len(entry_models))
+        rows: list[list[str]] = [entry_model.get_value_str_from_columns() for entry_model in entry_models[first_row_index:last_row_index]]
+        item_ids: list[str] = self.__item_ids
+        tree_insert = self.__tree.insert
+        for row_index, value_strings in enumerate(rows, first_row_index):
+            item_id: str = str(row_index)
+            item_ids.append(item_id)
+            tree_insert("", tk.END, text="", values=value_strings, iid=item_id)
+        self.__loaded_row_count = last_row_index
+
+    def __on_tree_yscroll(self, first: str, last: str) -> None:
+        self.__table_vert_scrollbar.set(first, last)
+        # load more rows once the bottom of the loaded rows becomes visible
+        if (float(last) >= 1.0 and self.__loaded_row_count < self.__table_model.get_entry_count()):
+            self.__load_more_rows()
+
+    # @brief Makes sure the row at the given index is inserted into the treeview.
+    def __ensure_row_loaded(self, row_index: int) -> None:
+        while (self.__loaded_row_count <= row_index and self.__loaded_row_count < self.__table_model.get_entry_count()):
+            self.__load_more_rows()
+
     def __get_cell_ids(self, event) -> tuple[str, str]:
         item_id = self.__tree.identify_row(event.y)
         column_id = self.__tree.identify_column(event.x)
@@ -151,52 +236,26 @@ class Table:
         else:
             return None
     
+    # @param cell_row_index the index of a loaded row
     def __get_cell_item_id(self, cell_row_index: int) -> str:
-        return str(cell_row_index)
+        return self.__item_ids[cell_row_index]
     
     def __get_cell_column_id(self, cell_column_index: int) -> str:
-        return "#" + str(cell_column_index + 1)
-
-    def __get_cell_value(self, cell_position: tuple[str, str] | tuple[int, int]) -> tuple[list[str], int, str] | None:
-        row_position, column_position = cell_position
-        if (isinstance(row_position, int) and isinstance(column_position, int)):
-            row_index: int = row_position
-            column_index: int = column_position
-            entry: EntryModel = self.__table_model.get_entry(row_index)
-            row_values: list[str] = entry.get_value_str_from_columns()
-            cell_value: str = entry.get_value_str_from_column(column_index)
-            return (row_values, column_index, cell_value)
-        elif (isinstance(row_position, str) and isinstance(column_position, str)):
-            cell_ids: tuple[str, str] = (row_position, column_position)
-            cell_indices: tuple[int, int] | None = self.__get_cell_indices(cell_ids)
-            if (cell_indices == None):
-                return None
-            return self.__get_cell_value(cell_indices)
-        else:
-            return None # compiler type-checking failed...
-
-    def __set_cell_value(self, cell_position: tuple[str, str] | tuple[int, int], cell_value: str) -> None:
-        row_position, column_position = cell_position
-        if (isinstance(row_position, int) and isinstance(column_position, int)):
-            # update the data model
-            row_index: int = row_position
-            column_index: int = column_position
-            entry: EntryModel = self.__table_model.get_entry(row_index)
-            entry.set_value_at_column(column_index, cell_value)
-
-            # update the GUI table
-            row_values: list[str] = entry.get_value_str_from_columns()
-            row_values[column_index] = cell_value
-            item_id: str = self.__get_cell_item_id(row_index)
-            self.__tree.item(item_id, values=tuple(row_values))
-        elif (isinstance(row_position, str) and isinstance(column_position, str)):
-            cell_ids: tuple[str, str] = (row_position, column_position)
-            cell_indices: tuple[int, int] | None = self.__get_cell_indices(cell_ids)
-            if (cell_indices == None):
-                return None
-            return self.__set_cell_value(cell_indices, cell_value)
-        else:
-            return None # compiler type-checking failed...
+        return self.__column_ids[cell_column_index]
+
+    def __get_cell_value_by_indices(self, row_index: int, column_index: int) -> str:
+        entry: EntryModel = self.__table_model.get_entry(row_index)
+        return entry.get_value_str_from_column(column_index)
+
+    def __set_cell_value_by_indices(self, row_index: int, column_index: int, cell_value: str) -> None:
+        # update the data model
+        entry: EntryModel = self.__table_model.get_entry(row_index)
+        entry.set_value_at_column(column_index, cell_value)
+
+        # update the GUI table
+        row_values: list[str] = entry.get_value_str_from_columns()
+        item_id: str = self.__get_cell_item_id(row_index)
+        self.__tree.item(item_id, values=row_values)
 
     def __update_cell_indices(self, cell_indices: tuple[int, int]) -> None:
         row_index, column_index = cell_indices
@@ -204,50 +263,73 @@ class Table:
             return
         self.__selected_row_index = row_index
         self.__selected_column_index = column_index
-        if self.is_cell_bar_visible():
-            self.__render_cell_bar(cell_indices)
-        
-        cell_values = self.__get_cell_value(cell_indices)
-        if (cell_values == None):
-            return
+        cell_value: str = self.__get_cell_value_by_indices(row_index, column_index)
+        if self.__cell_bar_visible:
+            self.__render_cell_bar(cell_value)
 
-        # destroy previous selected textbox
-        if (self.__selected_textbox != None):
-            self.__selected_textbox.destroy()
-            self.__selected_textbox = None
+        # keep the edits of the previous cell before the editor textbox is moved
+        self.__save_editor_textbox()
 
+        # scroll the cell into view, loading its row first if needed
+        self.__ensure_row_loaded(row_index)
         item_id: str = self.__get_cell_item_id(row_index)
         column_id: str = self.__get_cell_column_id(column_index)
+        self.__tree.see(item_id)
         # Get cell bounding box
-        x, y, width, height = self.__tree.bbox(item_id, column_id)
-        cell_value = cell_values[2]
-        # Create and position Entry widget
-        textbox: tk.Text = tk.Text(self.__tree, font=self.__default_font)
+        cell_bbox = self.__tree.bbox(item_id, column_id)
+        if (cell_bbox == ""):
+            self.__editor_textbox.place_forget()
+            return
+        x, y, width, height = cell_bbox
+        # move the editor textbox onto the cell
+        textbox: tk.Text = self.__editor_textbox
+        textbox.config(state=tk.NORMAL)
+        textbox.delete("1.0", tk.END)
         textbox.insert("1.0", cell_value)
+        textbox.edit_modified(False)
         textbox.place(x=x, y=y, width=width, height=height)
-        textbox.config(state=self.__get_editor_state())
-
-        def save_edit(event=None):
-            new_text = textbox.get("1.0", tk.END)
-            self.__set_cell_value(cell_indices, new_text)
+        textbox.config(state=self.__editor_state)
+        self.__editor_row_index = row_index
+        self.__editor_column_index = column_index
+
+    # @brief Writes the editor textbox back into its cell if it has been edited.
+    def __save_editor_textbox(self) -> None:
+        textbox: tk.Text = self.__editor_textbox
+        if ((not textbox.edit_modified()) or self.__editor_row_index < 0):
+            return
+        # "end-1c" drops the newline which tk.Text always appends
+        new_text: str = textbox.get("1.0", "end-1c")
+        self.__set_cell_value_by_indices(self.__editor_row_index, self.__editor_column_index, new_text)
+        textbox.edit_modified(False)
 
-        # textbox.bind("<FocusOut>", lambda e: entry.destroy())
-        textbox.bind("<FocusOut>", save_edit)
-        self.__selected_textbox = textbox
+    def __on_editor_focus_out(self, event) -> None:
+        self.__save_editor_textbox()
 
     def __on_up_arrow_key_clicked(self, event) -> None:
+        if (self.__selected_row_index < 0 or self.__selected_column_index < 0):
+            # no cell is selected yet
+            return
         if (self.__selected_row_index > 0):
             self.__update_cell_indices((self.__selected_row_index - 1, self.__selected_column_index))
 
     def __on_down_arrow_key_clicked(self, event) -> None:
+        if (self.__selected_row_index < 0 or self.__selected_column_index < 0):
+            # no cell is selected yet
+            return
         if (self.__selected_row_index + 1 < self.__table_model.get_entry_count()):
             self.__update_cell_indices((self.__selected_row_index + 1, self.__selected_column_index))
 
     def __on_left_arrow_key_clicked(self, event) -> None:
+        if (self.__selected_row_index < 0 or self.__selected_column_index < 0):
+            # no cell is selected yet
+            return
         if (self.__selected_column_index > 0):
             self.__update_cell_indices((self.__selected_row_index, self.__selected_column_index - 1))
 
     def __on_right_arrow_key_clicked(self, event) -> None:
+        if (self.__selected_row_index < 0 or self.__selected_column_index < 0):
+            # no cell is selected yet
+            return
         if (self.__selected_column_index + 1 < self.__table_model.get_column_count()):
             self.__update_cell_indices((self.__selected_row_index, self.__selected_column_index + 1))
 
@@ -265,12 +347,12 @@ class Table:
             return
         self.__update_cell_indices(cell_indices)
 
-        if (not self.is_editable()):
+        if (not self.__editable):
             return
 
         item_id, column_id = cell_ids
         if item_id and column_id:
-            if (self.is_cell_bar_visible()):
+            if (self.__cell_bar_visible):
                 # tamper the cell bar instead
                 if (self.__cell_bar != None):
                     self.__cell_bar.focus_set()
@@ -296,10 +378,8 @@ class Table:
                 # # entry.bind("<FocusOut>", lambda e: entry.destroy())
                 # entry.bind("<FocusOut>", save_edit)
 
-                # cell_values = self.__get_cell_value(cell_indices)
-                # if (cell_values == None):
-                #     return
-                # cell_value = cell_values[2]
+                # row_index, column_index = cell_indices
+                # cell_value = self.__get_cell_value_by_indices(row_index, column_index)
                 # # Create and position Entry widget
                 # textbox: tk.Text = tk.Text(self.__tree, font=self.__default_font)
                 # textbox.insert("1.0", cell_value)
@@ -308,7 +388,7 @@ class Table:
 
                 # def save_edit(event=None):
                 #     new_text = textbox.get("1.0", tk.END)
-                #     self.__set_cell_value(cell_ids, new_text)
+                #     self.__set_cell_value_by_indices(row_index, column_index, new_text)
                 #     textbox.destroy()
 
                 # # textbox.bind("<FocusOut>", lambda e: entry.destroy())
@@ -2,14 +2,17 @@
 
 # @brief An immutable header.
 class Header:
+    __slots__ = ("__column_names", "__column_count")
+
     def __init__(self, column_names: tuple[str]):
-        self.__column_names: tuple[str] = column_names
+        self.__column_names: tuple[str] = tuple(column_names)
+        self.__column_count: int = len(self.__column_names)
 
     def get_column_names(self) -> tuple[str]:
         return self.__column_names
 
     def get_column_count(self) -> int:
-        return len(self.__column_names)
+        return self.__column_count
 
     def get_copy(self) -> 'Header':
         return Header(self.__column_names)
@@ -17,98 +20,170 @@ class Header:
 # An entry is a row.
 # Every entry has a fixed amount of columns, thus is a fixed-length horizontal list.
 # In an entry, multiple unique values exist in every cell.
+# Every cell is stored as its value string joined by ", ",
+# the unique values are only tracked once a cell holds more than one value.
 class Entry:
-    def __init__(self, *, length: int = 0, values: list[str] = []):
-        if (values == None or len(values) == 0):
-            values = [""] * length
-        self.__column_count: int = len(values)
-        self.__cell_values: list[dict[str, object]] = []
-        for column_value in values:
-            if (column_value != ""):
-                self.__cell_values.append({column_value: None})
-            else:
-                self.__cell_values.append({})
+    # no per-instance __dict__, a table holds one Entry per CSV row
+    __slots__ = ("column_count", "__cell_values", "__multi_values")
+
+    __DEFAULT_SEPARATOR: str = ", "
+
+    # @brief Creates an entry with the given amount of empty cells.
+    def __init__(self, length: int = 0):
+        # the number of columns in this entry, read-only
+        self.column_count: int = length
+        self.__cell_values: list[str] = [""] * length
+        # column index -> unique values, only for cells with multiple values
+        self.__multi_values: dict[int, dict[str, object]] | None = None
+
+    # @brief Creates an entry holding one value per cell, e.g. a row read from a CSV file.
+    # @return a new Entry object, which holds a copy of the given row
+    @classmethod
+    def from_row(cls, row: list[str]) -> 'Entry':
+        entry: 'Entry' = cls.__new__(cls)
+        entry.column_count = len(row)
+        entry.__cell_values = list(row)
+        entry.__multi_values = None
+        return entry
     
     def append_value_to_column(self, column_index: int, value: str) -> None:
-        if (column_index < 0 or column_index >= self.__column_count):
+        if (column_index < 0 or column_index >= self.column_count):
             # return if index out of bounds
             return
         if (value == ""):
             # empty string
             return
-        # append the value into the dictionary as a key
-        self.__cell_values[column_index].update({value: None})
+        current_value: str = self.__cell_values[column_index]
+        if (self.__multi_values != None and column_index in self.__multi_values):
+            # append the value into the dictionary as a key
+            column_values: dict[str, object] = self.__multi_values[column_index]
+            if (value not in column_values):
+                column_values[value] = None
+                self.__cell_values[column_index] = current_value + self.__DEFAULT_SEPARATOR + value
+        elif (current_value == ""):
+            self.__cell_values[column_index] = value
+        elif (current_value != value):
+            # the cell now holds multiple values, start tracking them
+            if (self.__multi_values == None):
+                self.__multi_values = {}
+            self.__multi_values[column_index] = {current_value: None, value: None}
+            self.__cell_values[column_index] = current_value + self.__DEFAULT_SEPARATOR + value
     
     def set_value_at_column(self, column_index: int, value: str) -> None:
-        if (column_index < 0 or column_index >= self.__column_count):
+        if (column_index < 0 or column_index >= self.column_count):
             # return if index out of bounds
             return
         if (value == ""):
             # empty string
             return
-        # remove all key-value pairs from the dictionary
-        self.__cell_values[column_index].clear()
-        # append the value into the dictionary as a key
-        self.__cell_values[column_index].update({value: None})
+        # drop all other values of the cell
+        if (self.__multi_values != None):
+            self.__multi_values.pop(column_index, None)
+        self.__cell_values[column_index] = value
     
     def get_values_from_column(self, column_index: int) -> list[str]:
-        return list(self.__cell_values[column_index].keys())
+        if (self.__multi_values != None and column_index in self.__multi_values):
+            return list(self.__multi_values[column_index].keys())
+        cell_value: str = self.__cell_values[column_index]
+        return [cell_value] if (cell_value != "") else []
 
     def get_value_str_from_column(self, column_index: int, separator: str = ", ") -> str:
-        if (column_index < 0 or column_index >= self.__column_count):
+        if (column_index < 0 or column_index >= self.column_count):
             # return if index out of bounds
             return ""
-        return separator.join(self.get_values_from_column(column_index))
+        if (separator != self.__DEFAULT_SEPARATOR and self.__multi_values != None and column_index in self.__multi_values):
+            return separator.join(self.__multi_values[column_index].keys())
+        return self.__cell_values[column_index]
 
     def get_value_str_from_columns(self, separator: str = ", ") -> list[str]:
+        if (separator == self.__DEFAULT_SEPARATOR or self.__multi_values == None):
+            return list(self.__cell_values)
         value_strings: list[str] = []
-        for column_index in range(self.__column_count):
+        for column_index in range(self.column_count):
             value_string: str = self.get_value_str_from_column(column_index, separator)
             value_strings.append(value_string)
         return value_strings
+
+    # @return the value strings of all columns joined by ", ", e.g. as a hashable key of this entry
+    def get_value_str_tuple_from_columns(self) -> tuple[str, ...]:
+        return tuple(self.__cell_values)
     
     # @return the number of columns in this entry
     def get_column_count(self) -> int:
-        return self.__column_count
+        return self.column_count
 
     # @return a new Entry object, which is a deep copy of this entry
     def get_deep_copy(self) -> 'Entry':
-        deep_copy: 'Entry' = Entry(length = self.__column_count)
-        for column_index in range(self.__column_count):
-            column_values: list[str] = self.get_values_from_column(column_index)
-            for value in column_values:
-                deep_copy.append_value_to_column(column_index, value)
+        deep_copy: 'Entry' = Entry.from_row(self.__cell_values)
+        if (self.__multi_values != None):
+            deep_copy.__multi_values = {}
+            for column_index, column_values in self.__multi_values.items():
+                deep_copy.__multi_values[column_index] = dict(column_values)
         return deep_copy
 
+    # @return the unique values of the cell as dictionary keys, must not be modified
+    def __get_value_dict(self, column_index: int) -> dict[str, object]:
+        if (self.__multi_values != None and column_index in self.__multi_values):
+            return self.__multi_values[column_index]
+        cell_value: str = self.__cell_values[column_index]
+        return {cell_value: None} if (cell_value != "") else {}
+
+    # @brief Replaces the values of the cell by the keys of the given dictionary, which is taken over.
+    def __set_value_dict(self, column_index: int, column_values: dict[str, object]) -> None:
+        if (len(column_values) > 1):
+            if (self.__multi_values == None):
+                self.__multi_values = {}
+            self.__multi_values[column_index] = column_values
+            self.__cell_values[column_index] = self.__DEFAULT_SEPARATOR.join(column_values)
+            return
+        if (self.__multi_values != None):
+            self.__multi_values.pop(column_index, None)
+        self.__cell_values[column_index] = next(iter(column_values), "")
+
     # @param entries the other entries to be merged, no need to include this entry
+    # The cells of an entry beyond the column count of this entry are ignored.
     # @return a new Entry object, which is a deep copy of this entry and all other entries
     def merge_entries(self, entries: list['Entry']) -> 'Entry':
-        merged_entry: 'Entry' = self.get_deep_copy()
         if (entries == None or len(entries) == 0):
-            return merged_entry
-        for entry in entries:
-            for column_index in range(min(self.__column_count, entry.__column_count)):
-                column_values: list[str] = entry.get_values_from_column(column_index)
-                for value in column_values:
-                    merged_entry.append_value_to_column(column_index, value)
+            return self.get_deep_copy()
+        merged_entry: 'Entry' = Entry(self.column_count)
+        for column_index in range(self.column_count):
+            column_values: dict[str, object] = dict(self.__get_value_dict(column_index))
+            for entry in entries:
+                if (column_index < entry.column_count):
+                    # merge all values of the cell in a single dict.update()
+                    column_values.update(entry.__get_value_dict(column_index))
+            merged_entry.__set_value_dict(column_index, column_values)
         return merged_entry
 
 class Table:
+    __slots__ = ("__header", "__column_names", "__column_count", "__entries")
+
     def __init__(self, header: Header, entries: list[Entry] | None = None):
         self.__header: Header = header
-        self.__entries: list[Entry] = []
-        if (entries != None):
-            for entry in entries:
-                self.__entries.append(entry.get_deep_copy())
+        self.__column_names: tuple[str] = header.get_column_names()
+        self.__column_count: int = header.get_column_count()
+        # the entries are shared with the caller, use get_deep_copy() for an independent table
+        self.__entries: list[Entry] = list(entries) if (entries != None) else []
+
+    # @brief Creates a table which takes ownership of the given entries list.
+    # The entries are neither copied nor deep-copied,
+    # so the caller must not use the list or its entries afterwards.
+    # @return a new Table object, which owns the given entries
+    @classmethod
+    def from_entries(cls, header: Header, entries: list[Entry]) -> 'Table':
+        table: 'Table' = cls(header)
+        table.__entries = entries
+        return table
 
     def get_header(self) -> Header:
         return self.__header
 
     def get_column_names(self) -> tuple[str]:
-        return self.__header.get_column_names()
+        return self.__column_names
     
     def get_column_count(self) -> int:
-        return self.__header.get_column_count()
+        return self.__column_count
 
     def get_entries(self) -> list[Entry]:
         return self.__entries
@@ -132,13 +207,26 @@ class Table:
         self.__entries.remove(entry)
         return entry
 
+    # @return a new Table object, which holds a deep copy of every entry in this table
     def get_deep_copy(self) -> 'Table':
-        return Table(self.__header, self.__entries)
+        entries: list[Entry] = [entry.get_deep_copy() for entry in self.__entries]
+        return Table.from_entries(self.__header, entries)
+
+    # @brief Removes the entries whose cell values are identical to an earlier entry.
+    # @return a new Table object, which shares the first occurrence of every distinct entry with this table
+    def deduplicate(self) -> 'Table':
+        seen: dict[tuple[str, ...], Entry] = {}
+        for entry in self.__entries:
+            key: tuple[str, ...] = entry.get_value_str_tuple_from_columns()
+            if (key not in seen):
+                seen[key] = entry
+        return Table.from_entries(self.__header, list(seen.values()))
 
 import csv
 
 def CSV_to_table(csv_filepath: str, *, encoding="utf-8") -> Table:
-    with open(csv_filepath, 'r', encoding=encoding) as csv_file:
+    # newline='' lets the csv module handle line endings inside quoted cells
+    with open(csv_filepath, 'r', buffering=1 << 20, encoding=encoding, newline='') as csv_file:
         # create CSV reader
         csv_reader = csv.reader(csv_file)
 
@@ -148,22 +236,20 @@ def CSV_to_table(csv_filepath: str, *, encoding="utf-8") -> Table:
         header: Header = Header(header_tuple)
 
         # get the table entries
-        entries: list[Entry] = []
-        for row in csv_reader:
-            entry: Entry = Entry(values=row)
-            entries.append(entry)
+        entries: list[Entry] = [Entry.from_row(row) for row in csv_reader]
 
         # create a table from the header and the entries
-        return Table(header, entries)
+        # the entries are freshly created, no need to copy them
+        return Table.from_entries(header, entries)
 
 def table_to_CSV(table: Table, csv_filepath: str, *, encoding="utf-8") -> None:
     with open(csv_filepath, mode="w+t", encoding=encoding, newline='') as csv_file:
         # create CSV writer
-        csv_writer = csv.writer(csv_file)
+        # only quote the cells containing special characters
+        csv_writer = csv.writer(csv_file, quoting=csv.QUOTE_MINIMAL)
 
         # writes the table header
         csv_writer.writerow(table.get_column_names())
 
         # writes the table entries
-        for entry in table.get_entries():
-            csv_writer.writerow(entry.get_value_str_from_columns())
\ No newline at end of file
+        csv_writer.writerows(entry.get_value_str_from_columns() for entry in table.get_entries())
\ No newline at end of file